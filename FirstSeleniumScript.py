@@ -1,12 +1,10 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
+import os
 
 # Put your actual path here 👇
-service = Service(r"C:\Users\Asus\Downloads\chromedriver-win64\chromedriver-win64\chromedriver.exe")
+os.environ.setdefault("CHROMEDRIVER_PATH", r"C:\Users\Asus\Downloads\chromedriver-win64\chromedriver-win64\chromedriver.exe")
 
-options = Options()
-options.add_argument("--start-maximized")
+from driver_pool import get_driver
 
-driver = webdriver.Chrome(service=service, options=options)
+driver = get_driver()
+driver.delete_all_cookies()
 driver.get("https://www.google.com")
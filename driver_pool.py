@@ -0,0 +1,104 @@
+"""
+Shared Chrome session for the standalone scripts (sel.py, tanmay.py, FirstSeleniumScript.py).
+
+The browser is started once per process and the same driver is reused for every
+get_driver() call, so repeated tests don't pay the browser start-up cost each time.
+It is shut down automatically when Python exits.
+
+Set CHROMEDRIVER_PATH to use a specific chromedriver binary; otherwise a matching
+driver is fetched with webdriver-manager and its path is remembered for a day, so
+later runs start without asking webdriver-manager again.
+"""
+
+import atexit
+import base64
+import os
+import tempfile
+import time
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+_driver = None
+_driver_path = None
+DRIVER_PATH_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "selenium-scripts", "chromedriver_path")
+DRIVER_PATH_TTL = 24 * 60 * 60  # seconds; same as webdriver-manager's own cache validity
+
+
+def chromedriver_path():
+    global _driver_path
+    if os.environ.get("CHROMEDRIVER_PATH"):
+        return os.environ["CHROMEDRIVER_PATH"]
+    if _driver_path and os.path.exists(_driver_path):
+        return _driver_path
+    try:
+        if time.time() - os.path.getmtime(DRIVER_PATH_CACHE) < DRIVER_PATH_TTL:
+            with open(DRIVER_PATH_CACHE) as f:
+                path = f.read().strip()
+            if os.path.exists(path):
+                _driver_path = path
+                return path
+    except OSError:
+        pass
+    _driver_path = ChromeDriverManager().install()
+    try:
+        cache_dir = os.path.dirname(DRIVER_PATH_CACHE)
+        os.makedirs(cache_dir, exist_ok=True)
+        # write to a temp file and rename, so readers never see a half-written path
+        fd, tmp = tempfile.mkstemp(dir=cache_dir)
+        with os.fdopen(fd, "w") as f:
+            f.write(_driver_path)
+        os.replace(tmp, DRIVER_PATH_CACHE)
+    except OSError:
+        pass  # caching is only an optimisation
+    return _driver_path
+
+
+def _options():
+    options = Options()
+    options.add_argument("--start-maximized")
+    return options
+
+
+def _is_alive(driver):
+    try:
+        driver.current_window_handle  # fails if the window was closed or chromedriver died
+        return True
+    except WebDriverException:
+        return False
+
+
+def get_driver():
+    global _driver
+    if _driver is not None and not _is_alive(_driver):
+        _shutdown()
+    if _driver is None:
+        _driver = webdriver.Chrome(service=Service(chromedriver_path()), options=_options())
+    return _driver
+
+
+def _shutdown():
+    global _driver
+    if _driver is None:
+        return
+    try:
+        _driver.quit()
+    except Exception:
+        pass
+    _driver = None
+
+
+atexit.register(_shutdown)
+
+
+def save_screenshot(driver, path, quality=70):
+    """Save the viewport as a JPEG via CDP - a fraction of the size of save_screenshot()'s PNG."""
+    shot = driver.execute_cdp_cmd(
+        "Page.captureScreenshot",
+        {"format": "jpeg", "quality": quality, "captureBeyondViewport": False},
+    )
+    with open(path, "wb") as f:
+        f.write(base64.b64decode(shot["data"]))
@@ -3,6 +3,8 @@ Automation Testing Tool (prototype)
 
 Features:
 - Accepts a target URL and crawls same-domain pages up to a depth limit
+- Pages are tested in parallel by a pool of worker processes, each driving its own headless Chrome
+- Optionally (STATIC_FAST_PATH) pages that don't depend on JavaScript are checked over plain HTTP only
 - For each page it runs a set of automated checks:
   * HTTP status check
   * Page load success (Selenium)
@@ -27,27 +29,43 @@ Author: Prototype for Tanmay
 
 import sys
 import os
+import hashlib
 import time
 import json
 import re
 import socket
+import asyncio
+import threading
+import multiprocessing
+from functools import lru_cache, wraps
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from multiprocessing.util import Finalize
 from urllib.parse import urljoin, urlparse
 from datetime import datetime
 
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
-from webdriver_manager.chrome import ChromeDriverManager
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml.etree import ParserError
 from selenium import webdriver
 from selenium.common.exceptions import WebDriverException, TimeoutException, NoSuchElementException, ElementClickInterceptedException, StaleElementReferenceException
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from driver_pool import chromedriver_path, save_screenshot
 
 # --------------------- Config ---------------------
 CRAWL_DEPTH = 1                # depth for link discovery (0 = only start page)
 MAX_PAGES = 30                 # hard cap on number of pages crawled
 PAGE_LOAD_TIMEOUT = 20         # seconds
+DOM_READY_TIMEOUT = 10         # seconds to wait for the DOM before interacting
+CLICK_SETTLE_TIMEOUT = 1       # max seconds to wait for a button click to navigate / re-render
 FORM_INPUT_PRESET = {
     'text': 'test',
     'email': 'test@example.com',
@@ -57,30 +75,155 @@ FORM_INPUT_PRESET = {
 }
 SAFE_CLICK_BLACKLIST = [r'delete', r'remove', r'logout', r'signout', r'pay', r'purchase', r'buy']
 OUTPUT_DIR = 'reports'
+STATIC_FAST_PATH = False       # HTTP-only checks for static pages: skips console/screenshot/button checks
+LOAD_IMAGES = False            # the checks don't need images; enable for fully rendered screenshots
+MAX_WORKERS = os.cpu_count() or 4  # parallel Chrome worker processes
+USER_AGENT = 'Mozilla/5.0 (compatible; AutomationTester/0.1)'
+LINK_CHECK_CONCURRENCY = 10    # concurrent HEAD probes per page
+MAX_HOST_RPS = 8               # requests per second to any one host, shared by all workers
+STAGGER_STEP = 0.1             # seconds between workers' first loads on the same host
 # --------------------------------------------------
 
 
+_BLACKLIST_RE = re.compile('|'.join(SAFE_CLICK_BLACKLIST), re.IGNORECASE)
+
+
 def is_safe_text(text: str) -> bool:
-    if not text:
-        return True
-    text = text.lower()
-    for pattern in SAFE_CLICK_BLACKLIST:
-        if re.search(pattern, text):
-            return False
-    return True
+    return not (text and _BLACKLIST_RE.search(text))
+
+
+@lru_cache(maxsize=8192)
+def url_netloc(url):
+    # pages link to the same URLs over and over, so remember each parse
+    return normalise_netloc(urlparse(url))
+
+
+def normalise_netloc(parsed):
+    """netloc the way a browser reports `location.host`: lower-case host, default port dropped."""
+    host = parsed.hostname or ''
+    if ':' in host:  # IPv6 literal
+        host = f'[{host}]'
+    port = parsed.port
+    if port and port != {'http': 80, 'https': 443}.get(parsed.scheme):
+        host = f'{host}:{port}'
+    return host
+
+
+class DomainLimiter:
+    """Spaces out requests to each host so that at most `rps` per second are started.
+
+    Pass a Manager dict and Lock as `next_slot` / `lock` to share one budget between processes.
+    """
+
+    def __init__(self, rps, next_slot=None, lock=None):
+        if rps <= 0:
+            raise ValueError(f'rps must be positive, got {rps!r}')
+        self.min_interval = 1.0 / rps
+        self._lock = lock if lock is not None else threading.Lock()
+        # host -> earliest time the next request may start (monotonic time is system-wide)
+        self._next_slot = next_slot if next_slot is not None else {}
+
+    def reserve(self, url):
+        """Book the next free slot for url's host; returns how many seconds to wait for it."""
+        host = url_netloc(url)
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + self.min_interval
+        return slot - now
+
+    def wait(self, url):
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+
+async def _probe_async(session, url, limiter):
+    try:
+        await asyncio.sleep(limiter.reserve(url))
+        async with session.head(url, allow_redirects=True) as r:
+            status = r.status
+        if status in (403, 405):
+            # some servers refuse HEAD; the GET body is never read, only the status line
+            await asyncio.sleep(limiter.reserve(url))
+            async with session.get(url, allow_redirects=True) as r:
+                status = r.status
+        return status, ''
+    except Exception as e:
+        return None, str(e) or type(e).__name__
+
+
+def new_probe_session(timeout=8):
+    """aiohttp session for link probes; call from inside the event loop that will use it."""
+    # per-socket timeouts: time spent queueing for one of the pooled connections must not
+    # count against a probe, or slow hosts would report the tail of the batch as broken
+    return aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=LINK_CHECK_CONCURRENCY),
+                                 headers={'User-Agent': USER_AGENT},
+                                 timeout=aiohttp.ClientTimeout(sock_connect=timeout, sock_read=timeout))
+
+
+async def probe_all(session, urls, limiter):
+    """Probe all urls concurrently on one event loop; returns [(status_code, error), ...]."""
+    return await asyncio.gather(*(_probe_async(session, u, limiter) for u in urls))
+
+
+_SCRIPT_TAG_RE = re.compile(rb'<script[\s>]', re.IGNORECASE)
+_FORM_TAG_RE = re.compile(rb'<form[\s>]', re.IGNORECASE)
+
+
+def needs_js(html: bytes) -> bool:
+    """Cheap guess whether a page only renders properly with JavaScript (SPA / heavy scripting)."""
+    return b'__NEXT_DATA__' in html or len(_SCRIPT_TAG_RE.findall(html)) > 20
 
 
 def retry_on_stale(func):
+    # the wrapped methods look their elements up again on every call, so a retry
+    # can start straight away - there is nothing to gain from sleeping first
+    @wraps(func)
     def wrapper(*args, **kwargs):
-        for _ in range(3):
+        for _ in range(2):
             try:
                 return func(*args, **kwargs)
             except StaleElementReferenceException:
-                time.sleep(1)
-        raise
+                pass
+        return func(*args, **kwargs)
     return wrapper
 
 
+def build_driver(driver_path=None):
+    chrome_options = Options()
+    chrome_options.add_argument('--headless=new')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    # trim start-up work and background traffic that a test crawler never needs
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-background-networking')
+    chrome_options.add_argument('--disable-sync')
+    chrome_options.add_argument('--metrics-recording-only')
+    chrome_options.add_argument('--mute-audio')
+    chrome_options.add_argument('--disable-features=TranslateUI')
+    chrome_options.add_argument('--disable-renderer-backgrounding')
+    chrome_options.add_argument('--disable-backgrounding-occluded-windows')
+    if not LOAD_IMAGES:
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_argument('--window-size=1200,900')
+    # return from driver.get() at DOMContentLoaded instead of waiting for every image/ad/font
+    chrome_options.page_load_strategy = 'eager'
+    chrome_options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
+    # BiDi lets console errors be pushed to us instead of polled with get_log()
+    chrome_options.enable_bidi = True
+    # suppress noisy logs
+    chrome_options.add_argument('--disable-logging')
+    chrome_options.add_argument('--log-level=3')
+    chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
+
+    service = ChromeService(driver_path or chromedriver_path())
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    return driver
+
+
 class PageResult:
     def __init__(self, url):
         self.url = url
@@ -90,6 +233,16 @@ class PageResult:
     def add(self, name, passed, message=''):
         self.tests.append({'name': name, 'passed': bool(passed), 'message': message})
 
+    def to_dict(self):
+        return {'url': self.url, 'tests': self.tests, 'screenshot': self.screenshot}
+
+    @classmethod
+    def from_dict(cls, data):
+        result = cls(data['url'])
+        result.tests = data['tests']
+        result.screenshot = data['screenshot']
+        return result
+
     @property
     def passed_count(self):
         return sum(1 for t in self.tests if t['passed'])
@@ -100,32 +253,71 @@ class PageResult:
 
 
 class SiteTester:
-    def __init__(self, base_url):
+    def __init__(self, base_url, host_rps=MAX_HOST_RPS, driver_path=None, limiter=None, probe_cache=None):
         self.base_url = self.normalise(base_url)
         self.parsed_base = urlparse(self.base_url)
-        self.domain = self.parsed_base.netloc
+        self.domain = normalise_netloc(self.parsed_base)
         self.scheme = self.parsed_base.scheme
         self.visited = set()
         self.to_visit = [self.base_url]
         self.results = {}
         self.start_time = datetime.utcnow()
 
-        # selenium setup
-        chrome_options = Options()
-        chrome_options.headless = True
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1200,900')
-        chrome_options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
-        # suppress noisy logs
-        chrome_options.add_argument('--disable-logging')
-        chrome_options.add_argument('--log-level=3')
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-
-        service = ChromeService(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        self.driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        self._driver = None  # started lazily, see `driver`
+        self.driver_path = driver_path  # None -> resolved by chromedriver_path() on first use
+        self._console_errors = None  # filled by BiDi handlers; None -> fall back to get_log()
+
+        # one pooled session for all HTTP probes, so keep-alive connections are reused
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50,
+                              max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers['User-Agent'] = USER_AGENT
+        self.host_rps = host_rps
+        self.limiter = limiter or DomainLimiter(host_rps)
+        # url -> (status_code, error), kept for the whole crawl; crawl() shares one across all workers
+        self._probe_cache = probe_cache if probe_cache is not None else {}
+        # requests is thread-safe but Selenium is not: HTTP checks run on this helper
+        # thread while the calling thread keeps driving Chrome
+        self._http_checker = ThreadPoolExecutor(max_workers=1)
+        # event loop + aiohttp session for link probes, kept across pages and only used on _http_checker
+        self._aio_loop = None
+        self._aio_session = None
+
+    @property
+    def driver(self):
+        if self._driver is None:
+            self._driver = build_driver(self.driver_path)
+            self._subscribe_console()
+        return self._driver
+
+    def _subscribe_console(self):
+        try:
+            self._driver.script.add_console_message_handler(self._on_console_message)
+            self._driver.script.add_javascript_error_handler(self._on_javascript_error)
+            self._console_errors = []
+        except Exception:
+            self._console_errors = None  # BiDi not available in this Selenium/Chrome
+
+    def _on_console_message(self, entry):
+        if entry.level == 'error':
+            self._console_errors.append({'level': 'ERROR', 'message': entry.text})
+
+    def _on_javascript_error(self, entry):
+        self._console_errors.append({'level': 'SEVERE', 'message': entry.text})
+
+    def close(self):
+        self._http_checker.shutdown()
+        if self._aio_loop is not None:
+            if self._aio_session is not None:
+                self._aio_loop.run_until_complete(self._aio_session.close())
+            self._aio_loop.close()
+            self._aio_loop = self._aio_session = None
+        self.session.close()
+        if self._driver is not None:
+            self._driver.quit()
+            self._driver = None
 
     def normalise(self, url):
         if not url.startswith('http'):
@@ -134,16 +326,21 @@ class SiteTester:
 
     def same_domain(self, url):
         try:
-            p = urlparse(url)
-            return (p.netloc == '' or p.netloc == self.domain)
+            netloc = url_netloc(url)
+            return (netloc == '' or netloc == self.domain)
         except Exception:
             return False
 
-    def discover_links(self, page_source, base_url):
-        soup = BeautifulSoup(page_source, 'html.parser')
+    def discover_links(self, page_source, base_url, encoding=None):
+        # `encoding` is the HTTP charset for raw bytes; without it libxml2 only sees <meta charset>
+        parser = lxml.html.HTMLParser(encoding=encoding) if encoding else None
+        try:
+            hrefs = lxml.html.fromstring(page_source, parser=parser).xpath('//a/@href')
+        except (ParserError, ValueError, LookupError):  # empty document / XML declaration in a str / bad charset
+            return set()
         links = set()
-        for a in soup.find_all('a', href=True):
-            href = a['href'].strip()
+        for href in hrefs:
+            href = href.strip()
             if href.startswith('mailto:') or href.startswith('tel:'):
                 continue
             absolute = urljoin(base_url, href)
@@ -154,14 +351,61 @@ class SiteTester:
                 links.add(absolute)
         return links
 
-    def http_status_check(self, url):
+    def discover_links_js(self):
+        """Same as discover_links, but reads the hrefs from the live DOM in one script call."""
+        # filter and de-duplicate in the browser so only the links we keep cross the wire
+        hrefs = self.driver.execute_script(
+            "const links = new Set();"
+            " for (const a of document.querySelectorAll('a[href]')) {"
+            "   if ((a.protocol === 'http:' || a.protocol === 'https:') && a.host === arguments[0])"
+            "     links.add(a.href.split('#')[0]);"
+            " }"
+            " return Array.from(links);", self.domain
+        )
+        return set(hrefs)
+
+    def probe(self, url, timeout=8):
+        """Return (status_code, error) for url, probing each URL at most once per crawl."""
+        if url in self._probe_cache:
+            return self._probe_cache[url]
         try:
-            r = requests.head(url, allow_redirects=True, timeout=10)
-            return r.status_code, ''
+            self.limiter.wait(url)
+            r = self.session.head(url, allow_redirects=True, timeout=timeout)
+            if r.status_code in (403, 405):
+                # some servers refuse HEAD; a streamed GET gets the status without downloading the body
+                self.limiter.wait(url)
+                r = self.session.get(url, allow_redirects=True, timeout=timeout, stream=True)
+                r.close()
+            result = (r.status_code, '')
         except Exception as e:
-            return None, str(e)
+            result = (None, str(e))
+        self._probe_cache[url] = result
+        return result
+
+    def _probe_links(self, urls):
+        if self._aio_loop is None:
+            self._aio_loop = asyncio.new_event_loop()
+        return self._aio_loop.run_until_complete(self._probe_links_async(urls))
+
+    async def _probe_links_async(self, urls):
+        if self._aio_session is None:
+            self._aio_session = new_probe_session()
+        return await probe_all(self._aio_session, urls, self.limiter)
+
+    def http_status_check(self, url):
+        return self.probe(url, timeout=10)
+
+    def wait_for_dom(self):
+        """Barrier before interacting with a page loaded with the 'eager' strategy."""
+        WebDriverWait(self.driver, DOM_READY_TIMEOUT).until(
+            lambda d: d.execute_script('return document.readyState') != 'loading'
+        )
 
     def grab_console_errors(self):
+        """Return (and forget) the console errors seen since the previous call."""
+        if self._console_errors is not None:
+            errors, self._console_errors = self._console_errors, []
+            return errors
         try:
             logs = self.driver.get_log('browser')
             errors = [l for l in logs if l['level'].upper() in ('SEVERE', 'ERROR')]
@@ -182,20 +426,18 @@ class SiteTester:
         # (form filling logic unchanged, omitted here for brevity)
 
     @retry_on_stale
-    def check_internal_links(self, page_source, base_url, page_result: PageResult):
-        links = self.discover_links(page_source, base_url)
+    def check_internal_links(self, links, page_result: PageResult):
+        links = list(links)[:20]
+        pending = [link for link in links if link not in self._probe_cache]
+        if pending:
+            self._probe_cache.update(zip(pending, self._probe_links(pending)))
         broken = []
-        checked = 0
         for link in links:
-            if checked >= 20:
-                break
-            try:
-                r = requests.head(link, allow_redirects=True, timeout=8)
-                if r.status_code >= 400:
-                    broken.append((link, r.status_code))
-            except Exception as e:
-                broken.append((link, str(e)))
-            checked += 1
+            status, err = self._probe_cache[link]
+            if status is None:
+                broken.append((link, err))
+            elif status >= 400:
+                broken.append((link, status))
         if broken:
             page_result.add('broken_links', False, f'{len(broken)} broken or problematic links (sample: {broken[:3]})')
         else:
@@ -203,23 +445,58 @@ class SiteTester:
 
     @retry_on_stale
     def safe_click_buttons(self, page_result: PageResult):
+        # read every button's label in one round-trip instead of two WebDriver calls per button
         try:
-            buttons = self.driver.find_elements(By.TAG_NAME, 'button')
+            buttons = self.driver.execute_script(
+                "return Array.from(document.querySelectorAll('button'),"
+                " (b, i) => [i, b.innerText, b.getAttribute('aria-label')]);"
+            )
         except Exception:
             buttons = []
+        main_window = self.driver.current_window_handle
         clicked = 0
-        for b in buttons:
+        for index, inner_text, aria_label in buttons:
             if clicked >= 3:
                 break
-            text = (b.text or b.get_attribute('aria-label') or '')
+            text = (inner_text or aria_label or '')
             if not is_safe_text(text):
                 continue
             try:
-                b.click()
-                time.sleep(1)
+                old_url = self.driver.current_url
+                old_windows = set(self.driver.window_handles)
+                # re-query by index: after driver.back() the previous element handles are gone.
+                # Earlier clicks may have added/removed buttons, so only click if the label at
+                # that index is still the one we vetted. Form buttons submit into a new tab so
+                # the page under test stays loaded.
+                button = self.driver.execute_script(
+                    "const b = document.querySelectorAll('button')[arguments[0]];"
+                    " if (!b || (b.innerText || b.getAttribute('aria-label') || '') !== arguments[1]) return null;"
+                    " const f = b.form, target = f && f.target;"
+                    " if (f) f.target = '_blank';"
+                    " b.click();"
+                    " if (f) f.target = target;"
+                    " return b;", index, text
+                )
+                if button is None:
+                    continue  # the page changed under us; don't click something we didn't check
+                try:
+                    WebDriverWait(self.driver, CLICK_SETTLE_TIMEOUT).until(
+                        lambda d: d.current_url != old_url or EC.staleness_of(button)(d)
+                        or len(d.window_handles) > len(old_windows)
+                    )
+                except TimeoutException:
+                    pass  # the click changed nothing we can observe
                 page_result.add(f'button_click_{clicked}', True, f'Clicked button: "{text}"')
-                self.driver.back()
-                time.sleep(1)
+                new_windows = set(self.driver.window_handles) - old_windows
+                for handle in new_windows:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                if new_windows:
+                    self.driver.switch_to.window(main_window)
+                # script-driven navigation can't be redirected to a tab; undo it the slow way
+                if self.driver.current_url != old_url:
+                    self.driver.back()
+                    WebDriverWait(self.driver, DOM_READY_TIMEOUT).until(EC.url_to_be(old_url))
                 clicked += 1
             except Exception as e:
                 page_result.add(f'button_click_{clicked}', False, f'Could not click "{text}" - {e}')
@@ -227,7 +504,148 @@ class SiteTester:
         if clicked == 0:
             page_result.add('button_clicks', True, 'No safe clickable buttons found or none clicked')
 
+    def capture_screenshot(self, page_result: PageResult):
+        shots_dir = os.path.join(OUTPUT_DIR, 'screenshots')
+        os.makedirs(shots_dir, exist_ok=True)
+        name = re.sub(r'[^A-Za-z0-9]+', '_', page_result.url).strip('_')[:100] or 'page'
+        # the readable part is truncated, so add a hash to keep long URLs with a shared prefix apart
+        digest = hashlib.sha1(page_result.url.encode('utf-8')).hexdigest()[:10]
+        path = os.path.join(shots_dir, f'{name}_{digest}.jpg')
+        try:
+            save_screenshot(self.driver, path)
+            page_result.screenshot = path
+            page_result.add('screenshot', True, path)
+        except (WebDriverException, OSError) as e:
+            page_result.add('screenshot', False, str(e))
+
+    def test_static_page(self, url):
+        """HTTP-only version of test_page; returns None when the page needs a real browser."""
+        try:
+            self.limiter.wait(url)
+            r = self.session.get(url, allow_redirects=True, timeout=10, stream=True)
+        except Exception:
+            return None  # let the browser path report the failure
+        # if we fall back to Chrome, its status check reuses this answer instead of sending a HEAD
+        self._probe_cache[url] = (r.status_code, '')
+        with r:
+            # only download the body for HTML; PDFs, archives and media go straight to the browser path
+            if 'html' not in r.headers.get('Content-Type', ''):
+                return None
+            try:
+                html = r.content
+            except requests.RequestException:
+                return None
+        if needs_js(html):
+            return None
+        page_result = PageResult(url)
+        page_result.add('http_status', r.status_code < 400, f'HTTP {r.status_code}')
+        forms = len(_FORM_TAG_RE.findall(html))
+        page_result.add('forms_detected', True, f'{forms} form(s)' if forms else 'No forms on page')
+        # requests guesses ISO-8859-1 when the header has no charset; only trust an explicit one
+        charset = r.encoding if 'charset=' in r.headers.get('Content-Type', '').lower() else None
+        links = self.discover_links(html, r.url, encoding=charset)
+        if not links:
+            return None  # probably a JS shell (<div id="root"> + bundle) that renders its links client-side
+        # link probes always run on the helper thread, which owns the aiohttp loop
+        self._http_checker.submit(self.check_internal_links, links, page_result).result()
+        return page_result, links
+
+    def test_page(self, url):
+        """Run every check against one page; returns (PageResult, same-domain links)."""
+        if STATIC_FAST_PATH:
+            static = self.test_static_page(url)
+            if static is not None:
+                return static
+        page_result = PageResult(url)
+        status_check = self._http_checker.submit(self.http_status_check, url)
+        try:
+            self.limiter.wait(url)
+            self.driver.get(url)
+            self.wait_for_dom()
+            load_error = None
+        except (TimeoutException, WebDriverException) as e:
+            load_error = e
+        status, err = status_check.result()
+        page_result.add('http_status', status is not None and status < 400, f'HTTP {status}' if status else err)
+        if load_error is not None:
+            page_result.add('page_load', False, str(load_error))
+            return page_result, set()
+        page_result.add('page_load', True, self.driver.title)
+        links = self.discover_links_js()
+        # probe the links in the background while Chrome works through the interactive checks
+        link_result = PageResult(url)
+        link_check = self._http_checker.submit(self.check_internal_links, links, link_result)
+        self.capture_screenshot(page_result)
+        self.fill_and_submit_forms(page_result)
+        self.safe_click_buttons(page_result)
+        # read console errors last: with the 'eager' strategy, deferred/onload scripts and the
+        # button clicks only report after DOMContentLoaded
+        errors = self.grab_console_errors()
+        page_result.add('console_errors', not errors, f'{len(errors)} console error(s)' if errors else 'No console errors')
+        link_check.result()
+        page_result.tests.extend(link_result.tests)
+        return page_result, links
+
+    def crawl(self, max_workers=MAX_WORKERS):
+        """Breadth-first crawl; the pages of each depth level are tested in parallel."""
+        # resolve chromedriver once here, so the workers don't all race webdriver-manager on a cold cache
+        driver_path = self.driver_path or chromedriver_path()
+        with multiprocessing.Manager() as manager:
+            # one per-host budget for the whole pool, so idle workers don't hold on to a share of it
+            limiter = DomainLimiter(self.host_rps, manager.dict(), manager.Lock())
+            # likewise one probe cache, so shared nav links are probed once per crawl, not once per worker
+            probe_cache = manager.dict()
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                     initargs=(self.base_url, limiter, probe_cache, driver_path)) as pool:
+                for _ in range(CRAWL_DEPTH + 1):
+                    batch = []
+                    while self.to_visit and len(self.visited) + len(batch) < MAX_PAGES:
+                        url = self.to_visit.pop(0)
+                        if url not in self.visited and url not in batch:
+                            batch.append(url)
+                    if not batch:
+                        break
+                    self.visited.update(batch)
+                    # stagger the first wave so the workers don't all hit the host at the same instant
+                    futures = {pool.submit(_process_page, url, i * STAGGER_STEP if i < max_workers else 0.0): url
+                               for i, url in enumerate(batch)}
+                    discovered = set()
+                    for future in as_completed(futures):
+                        url = futures[future]
+                        try:
+                            data, links = future.result()
+                        except Exception as e:
+                            # one bad page (alert on load, broken script...) must not lose the rest of the crawl
+                            page_result = PageResult(url)
+                            page_result.add('page_load', False, f'{type(e).__name__}: {e}')
+                            self.results[url] = page_result
+                            continue
+                        self.results[data['url']] = PageResult.from_dict(data)
+                        discovered.update(links)
+                    self.to_visit.extend(sorted(discovered - self.visited))
+        return self.results
+
     # (rest of SiteTester code unchanged, omitted here for brevity)
 
 
+# --------------------- Worker processes ---------------------
+# Selenium is not thread-safe, so every worker process owns one SiteTester (and
+# with it one Chrome instance) that is reused for all pages sent to that worker.
+_tester = None
+
+
+def _init_worker(base_url, limiter, probe_cache, driver_path):
+    global _tester
+    _tester = SiteTester(base_url, driver_path=driver_path, limiter=limiter, probe_cache=probe_cache)
+    # pool workers exit without running atexit hooks, but multiprocessing finalizers do run
+    Finalize(_tester, _tester.close, exitpriority=10)
+
+
+def _process_page(url, delay=0.0):
+    if delay:
+        time.sleep(delay)
+    page_result, links = _tester.test_page(url)
+    return page_result.to_dict(), links
+
+
 # main() remains unchanged
@@ -1,6 +1,6 @@
 import tkinter as tk
 from tkinter import messagebox
-from selenium import webdriver
+from driver_pool import get_driver, save_screenshot
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -13,8 +13,8 @@ def run_test():
         url = "http://" + url
 
     try:
-        driver = webdriver.Chrome()
-        driver.maximize_window()
+        driver = get_driver()  # browser stays open between runs
+        driver.delete_all_cookies()
         driver.get(url)
 
         results = []
@@ -28,8 +28,8 @@ def run_test():
         results.append(f"Found {len(links)} links on page")
 
         # 3. Screenshot
-        driver.save_screenshot("screenshot.png")
-        results.append("Screenshot saved as screenshot.png")
+        save_screenshot(driver, "screenshot.jpg")
+        results.append("Screenshot saved as screenshot.jpg")
 
         # 4. Wait for body
         try:
@@ -45,11 +45,6 @@ def run_test():
 
     except Exception as e:
         messagebox.showerror("Error", str(e))
-    finally:
-        try:
-            driver.quit()
-        except:
-            pass
 
 
 # ---------------- GUI ----------------
@@ -1,4 +1,4 @@
-from selenium import webdriver
+from driver_pool import get_driver, save_screenshot
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
@@ -6,8 +6,8 @@ from selenium.webdriver.support import expected_conditions as EC
 import time
 
 # --- Setup ---
-driver = webdriver.Chrome()
-driver.maximize_window()
+driver = get_driver()
+driver.delete_all_cookies()
 wait = WebDriverWait(driver, 10)
 
 # --- 1) Open YouTube ---
@@ -27,9 +27,8 @@ video.click()
 
 # --- 4) Wait while video plays ---
 time.sleep(10)   # play for 10 seconds
-driver.save_screenshot("youtube_video.png")
+save_screenshot(driver, "youtube_video.jpg")
 print("✅ Screenshot saved")
 
-# --- 5) Finish ---
-driver.quit()
+# --- 5) Finish ---  (browser is closed automatically on exit)
 print("🎉 YouTube automation complete!")